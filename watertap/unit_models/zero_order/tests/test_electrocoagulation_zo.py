@@ -12,6 +12,10 @@
 """
 Tests for zero-order EC model
 """
+from dataclasses import dataclass, field
+from operator import attrgetter
+
+import numpy as np
 import pytest
 
 
@@ -44,451 +48,220 @@ from watertap.core.wt_database import Database
 from watertap.core.zero_order_properties import WaterParameterBlock
 from watertap.costing.zero_order_costing import ZeroOrderCosting
 
-solver = get_solver()
-
-
-class TestECZO_AL:
-    @pytest.fixture(scope="class")
-    def model(self):
-        m = ConcreteModel()
-        m.db = Database()
-
-        m.fs = FlowsheetBlock(dynamic=False)
-        m.fs.params = WaterParameterBlock(
-            solute_list=[
-                "tds",
-                "tss",
-                "toc",
-            ]
-        )
-
-        m.fs.unit = ElectrocoagulationZO(property_package=m.fs.params, database=m.db)
-
-        m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(43.8)
-        m.fs.unit.inlet.flow_mass_comp[0, "toc"].fix(0.004599)
-        m.fs.unit.inlet.flow_mass_comp[0, "tss"].fix(0.5527998)
-        m.fs.unit.inlet.flow_mass_comp[0, "tds"].fix(5.256)
-
-        return m
-
-    @pytest.mark.unit
-    def test_build(self, model):
-        assert isinstance(model.fs.unit.config.electrode_material, ElectrodeMaterial)
-        assert isinstance(model.fs.unit.config.reactor_material, ReactorMaterial)
-        assert isinstance(
-            model.fs.unit.config.overpotential_calculation, OverpotentialCalculation
-        )
-        assert model.fs.unit.config.electrode_material == ElectrodeMaterial.aluminum
-        assert model.fs.unit.config.reactor_material == ReactorMaterial.pvc
-        assert (
-            model.fs.unit.config.overpotential_calculation
-            == OverpotentialCalculation.fixed
-        )
-        assert value(model.fs.unit.mw_electrode_material) == 0.027
-        assert value(model.fs.unit.valence_electrode_material) == 3
-        assert value(model.fs.unit.density_electrode_material) == 2710
-        assert model.fs.unit.config.database == model.db
-        assert model.fs.unit._tech_type == "electrocoagulation"
-        assert isinstance(model.fs.unit.mw_electrode_material, Param)
-        assert isinstance(model.fs.unit.valence_electrode_material, Param)
-        assert isinstance(model.fs.unit.density_electrode_material, Param)
-        assert isinstance(model.fs.unit.recovery_frac_mass_H2O, Var)
-        assert isinstance(model.fs.unit.removal_frac_mass_comp, Var)
-        assert isinstance(model.fs.unit.power_required, Var)
-        assert isinstance(model.fs.unit.overpotential, Var)
-        assert isinstance(model.fs.unit.ohmic_resistance, Var)
-
-    @pytest.mark.component
-    def test_load_parameters(self, model):
-        data = model.db.get_unit_operation_parameters("electrocoagulation")
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.8
-        model.fs.unit.load_parameters_from_database(use_default_removal=True)
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.99
-
-        for (t, j), v in model.fs.unit.removal_frac_mass_comp.items():
-            assert v.fixed
-            if j not in data["removal_frac_mass_comp"]:
-                assert v.value == data["default_removal_frac_mass_comp"]["value"]
-            else:
-                assert v.value == data["removal_frac_mass_comp"][j]["value"]
-
-    @pytest.mark.component
-    def test_degrees_of_freedom(self, model):
-        assert degrees_of_freedom(model.fs.unit) == 0
-
-    @pytest.mark.component
-    def test_unit_consistency(self, model):
-        assert_units_consistent(model.fs.unit)
-
-    @pytest.mark.component
-    def test_scaling(self, model):
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("H2O"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tds"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tss"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e4, index=("toc"))
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["H2O"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["tss"], 1e3
-        )
-        iscale.calculate_scaling_factors(model)
-        badly_scaled_var_list = list(iscale.badly_scaled_var_generator(model))
-        assert len(badly_scaled_var_list) == 0
-
-    @pytest.mark.component
-    def test_initialize(self, model):
-        initialization_tester(model)
-
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
-
-        # Check for optimal solution
-        assert check_optimal_termination(results)
-
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solution(self, model):
-        assert pytest.approx(43.3619999, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["H2O"]
-        )
-        assert pytest.approx(1.5768, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"]
-        )
-        assert pytest.approx(0.165839, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"]
-        )
-        assert pytest.approx(0.00137970000, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"]
-        )
-        assert pytest.approx(53188.5028, rel=1e-2) == value(
-            model.fs.unit.applied_current
-        )
-        assert pytest.approx(2, rel=1e-2) == value(model.fs.unit.cell_voltage)
-        assert pytest.approx(9.4e-6, rel=1e-2) == value(model.fs.unit.ohmic_resistance)
-        assert pytest.approx(106377, rel=1e-2) == value(model.fs.unit.power_required)
-
-    @pytest.mark.component
-    def test_costing(self, model):
-        m = model
-        ec = m.fs.unit
-        m.fs.costing = ZeroOrderCosting()
-        m.fs.costing.base_currency = pyunits.USD_2018
-        ec.costing = UnitModelCostingBlock(flowsheet_costing_block=m.fs.costing)
-        m.fs.costing.cost_process()
-        m.fs.costing.add_LCOW(ec.properties_treated[0].flow_vol)
-        m.fs.costing.add_electricity_intensity(ec.properties_treated[0].flow_vol)
-        assert "aluminum" in m.fs.costing._registered_flows
-        assert (
-            value(m.fs.costing.electrocoagulation.ec_reactor_cap_material_coeff[None])
-            == 0.062
-        )
-        assert (
-            value(m.fs.costing.electrocoagulation.electrode_material_cost[None]) == 2.23
-        )
-        assert isinstance(m.fs.costing.electrocoagulation, Block)
-        assert isinstance(
-            m.fs.costing.electrocoagulation.ec_power_supply_base_slope, Var
-        )
-        assert isinstance(m.fs.costing.electrocoagulation.ec_reactor_cap_base, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost_constraint, Constraint)
-
-        assert degrees_of_freedom(m.fs.unit) == 0
-
-        results = solver.solve(m)
-        check_optimal_termination(results)
-        assert pytest.approx(0.34090, rel=1e-3) == value(m.fs.costing.LCOW)
-        assert pytest.approx(0.65510, rel=1e-3) == value(
-            m.fs.costing.electricity_intensity
-        )
-        assert pytest.approx(4928.611, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_reactor
-        )
-        assert pytest.approx(55926.1017, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_power_supply
-        )
-
-        assert pytest.approx(13006.1652, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_electrodes
-        )
-
-        assert (
-            ec.costing.electricity_flow in m.fs.costing._registered_flows["electricity"]
-        )
-
-
-class TestECZO_FE:
-    @pytest.fixture(scope="class")
-    def model(self):
-        m = ConcreteModel()
-        m.db = Database()
-
-        m.fs = FlowsheetBlock(dynamic=False)
-        m.fs.params = WaterParameterBlock(
-            solute_list=[
-                "tds",
-                "tss",
-                "toc",
-            ]
-        )
-
-        m.fs.unit = ElectrocoagulationZO(
-            property_package=m.fs.params,
-            database=m.db,
-            electrode_material="iron",
-            reactor_material="stainless_steel",
-        )
-
-        m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(43.8)
-        m.fs.unit.inlet.flow_mass_comp[0, "toc"].fix(0.004599)
-        m.fs.unit.inlet.flow_mass_comp[0, "tss"].fix(0.5527998)
-        m.fs.unit.inlet.flow_mass_comp[0, "tds"].fix(5.256)
-
-        return m
 
-    @pytest.mark.unit
-    def test_build(self, model):
-        assert isinstance(model.fs.unit.config.electrode_material, ElectrodeMaterial)
-        assert isinstance(model.fs.unit.config.reactor_material, ReactorMaterial)
-        assert isinstance(
-            model.fs.unit.config.overpotential_calculation, OverpotentialCalculation
-        )
-        assert model.fs.unit.config.electrode_material == ElectrodeMaterial.iron
-        assert model.fs.unit.config.reactor_material == ReactorMaterial.stainless_steel
-        assert (
-            model.fs.unit.config.overpotential_calculation
-            == OverpotentialCalculation.fixed
-        )
-        assert value(model.fs.unit.mw_electrode_material) == 0.056
-        assert value(model.fs.unit.valence_electrode_material) == 2
-        assert value(model.fs.unit.density_electrode_material) == 7860
-        assert model.fs.unit.config.database == model.db
-        assert model.fs.unit._tech_type == "electrocoagulation"
-        assert isinstance(model.fs.unit.mw_electrode_material, Param)
-        assert isinstance(model.fs.unit.valence_electrode_material, Param)
-        assert isinstance(model.fs.unit.density_electrode_material, Param)
-        assert isinstance(model.fs.unit.recovery_frac_mass_H2O, Var)
-        assert isinstance(model.fs.unit.removal_frac_mass_comp, Var)
-        assert isinstance(model.fs.unit.power_required, Var)
-        assert isinstance(model.fs.unit.overpotential, Var)
-        assert isinstance(model.fs.unit.ohmic_resistance, Var)
+@pytest.fixture(scope="module")
+def solver():
+    return get_solver()
 
-    @pytest.mark.component
-    def test_load_parameters(self, model):
-        data = model.db.get_unit_operation_parameters("electrocoagulation")
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.8
-        model.fs.unit.load_parameters_from_database(use_default_removal=True)
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.99
 
-        for (t, j), v in model.fs.unit.removal_frac_mass_comp.items():
-            assert v.fixed
-            if j not in data["removal_frac_mass_comp"]:
-                assert v.value == data["default_removal_frac_mass_comp"]["value"]
-            else:
-                assert v.value == data["removal_frac_mass_comp"][j]["value"]
+# Inlet mass flows [kg/s]
+inlet_flow_mass_comp = {"H2O": 43.8, "toc": 0.004599, "tss": 0.5527998, "tds": 5.256}
 
-    @pytest.mark.component
-    def test_degrees_of_freedom(self, model):
-        assert degrees_of_freedom(model.fs.unit) == 0
 
-    @pytest.mark.component
-    def test_unit_consistency(self, model):
-        assert_units_consistent(model.fs.unit)
+def build_model(**unit_kwargs):
+    m = ConcreteModel()
+    m.db = Database()
 
-    @pytest.mark.component
-    def test_scaling(self, model):
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("H2O"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tds"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tss"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e4, index=("toc"))
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["H2O"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["tss"], 1e3
-        )
-        iscale.calculate_scaling_factors(model)
-        badly_scaled_var_list = list(iscale.badly_scaled_var_generator(model))
-        assert len(badly_scaled_var_list) == 0
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.params = WaterParameterBlock(
+        solute_list=[
+            "tds",
+            "tss",
+            "toc",
+        ]
+    )
 
-    @pytest.mark.component
-    def test_initialize(self, model):
-        initialization_tester(model)
+    m.fs.unit = ElectrocoagulationZO(
+        property_package=m.fs.params, database=m.db, **unit_kwargs
+    )
 
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solve(self, model):
-        results = solver.solve(model)
+    flow_mass_comp = m.fs.unit.inlet.flow_mass_comp
+    for j, flow in inlet_flow_mass_comp.items():
+        flow_mass_comp[0, j].fix(flow)
 
-        # Check for optimal solution
-        assert check_optimal_termination(results)
+    return m
 
-    @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
-    @pytest.mark.component
-    def test_solution(self, model):
-        assert pytest.approx(43.3619999, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["H2O"]
-        )
-        assert pytest.approx(1.5768, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"]
-        )
-        assert pytest.approx(0.165839, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"]
-        )
-        assert pytest.approx(0.00137970000, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"]
-        )
-        assert pytest.approx(17096.3045, rel=1e-2) == value(
-            model.fs.unit.applied_current
-        )
-        assert pytest.approx(2, rel=1e-2) == value(model.fs.unit.cell_voltage)
-        assert pytest.approx(2.925e-5, rel=1e-2) == value(
-            model.fs.unit.ohmic_resistance
-        )
-        assert pytest.approx(34192.609, rel=1e-2) == value(model.fs.unit.power_required)
 
-    @pytest.mark.component
-    def test_costing(self, model):
+# Expected treated mass flows [kg/s], identical for all cases
+treated_flow_mass_comp = {
+    "H2O": 43.3619999,
+    "tds": 1.5768,
+    "tss": 0.165839,
+    "toc": 0.00137970000,
+}
 
-        m = model
-        ec = m.fs.unit
-        m.fs.costing = ZeroOrderCosting()
-        m.fs.costing.base_currency = pyunits.USD_2018
-        ec.costing = UnitModelCostingBlock(flowsheet_costing_block=m.fs.costing)
-        m.fs.costing.cost_process()
-        m.fs.costing.add_LCOW(ec.properties_treated[0].flow_vol)
-        m.fs.costing.add_electricity_intensity(ec.properties_treated[0].flow_vol)
-        assert "iron" in m.fs.costing._registered_flows
-        assert (
-            value(m.fs.costing.electrocoagulation.ec_reactor_cap_material_coeff[None])
-            == 3.4
-        )
-        assert (
-            value(m.fs.costing.electrocoagulation.electrode_material_cost[None]) == 3.41
-        )
-        assert isinstance(m.fs.costing.electrocoagulation, Block)
-        assert isinstance(
-            m.fs.costing.electrocoagulation.ec_power_supply_base_slope, Var
-        )
-        assert isinstance(m.fs.costing.electrocoagulation.ec_reactor_cap_base, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost_constraint, Constraint)
-
-        assert degrees_of_freedom(m.fs.unit) == 0
 
-        results = solver.solve(m)
-        check_optimal_termination(results)
-        assert pytest.approx(0.4696, rel=1e-3) == value(m.fs.costing.LCOW)
-        assert pytest.approx(0.21057, rel=1e-3) == value(
-            m.fs.costing.electricity_intensity
-        )
-        assert pytest.approx(162180.930, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_reactor
-        )
-        assert pytest.approx(17976.2465, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_power_supply
-        )
-
-        assert pytest.approx(18541.1436, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_electrodes
-        )
-
-        assert (
-            ec.costing.electricity_flow in m.fs.costing._registered_flows["electricity"]
-        )
+# Default flow_mass_comp scaling factors and per-state-block overrides
+default_scaling = {"H2O": 1e-3, "tds": 1e-3, "tss": 1e-3, "toc": 1e4}
+state_scaling = (
+    ("properties_treated", {"tds": 1e3, "tss": 1e3, "toc": 1e3}),
+    ("properties_byproduct", {"H2O": 1e3, "tss": 1e3}),
+)
 
 
-class TestECZO_OverpotentialCalculation:
+def set_scaling(m):
+    for j, sf in default_scaling.items():
+        m.fs.params.set_default_scaling("flow_mass_comp", sf, index=j)
+    for sb, sfs in state_scaling:
+        flow_mass_comp = getattr(m.fs.unit, sb)[0].flow_mass_comp
+        for j, sf in sfs.items():
+            iscale.set_scaling_factor(flow_mass_comp[j], sf)
+
+
+@dataclass
+class ECCase:
+    id: str
+    # config arguments passed to ElectrocoagulationZO; missing keys use defaults
+    config: dict
+    electrode_material: ElectrodeMaterial
+    reactor_material: ReactorMaterial
+    overpotential_calculation: OverpotentialCalculation
+    mw_electrode_material: float
+    valence_electrode_material: int
+    density_electrode_material: float
+    ec_reactor_cap_material_coeff: float
+    electrode_material_cost: float
+    # expected values of scalar unit model Vars after solve
+    solution: dict = field(default_factory=dict)
+    # expected values after solving with costing, keyed by path relative to m.fs
+    costing: dict = field(default_factory=dict)
+
+
+cases = [
+    ECCase(
+        id="AL",
+        config={},
+        electrode_material=ElectrodeMaterial.aluminum,
+        reactor_material=ReactorMaterial.pvc,
+        overpotential_calculation=OverpotentialCalculation.fixed,
+        mw_electrode_material=0.027,
+        valence_electrode_material=3,
+        density_electrode_material=2710,
+        ec_reactor_cap_material_coeff=0.062,
+        electrode_material_cost=2.23,
+        solution={
+            "applied_current": 53188.5028,
+            "cell_voltage": 2,
+            "ohmic_resistance": 9.4e-6,
+            "power_required": 106377,
+        },
+        costing={
+            "costing.LCOW": 0.34090,
+            "costing.electricity_intensity": 0.65510,
+            "unit.costing.capital_cost_reactor": 4928.611,
+            "unit.costing.capital_cost_power_supply": 55926.1017,
+            "unit.costing.capital_cost_electrodes": 13006.1652,
+        },
+    ),
+    ECCase(
+        id="FE",
+        config={
+            "electrode_material": "iron",
+            "reactor_material": "stainless_steel",
+        },
+        electrode_material=ElectrodeMaterial.iron,
+        reactor_material=ReactorMaterial.stainless_steel,
+        overpotential_calculation=OverpotentialCalculation.fixed,
+        mw_electrode_material=0.056,
+        valence_electrode_material=2,
+        density_electrode_material=7860,
+        ec_reactor_cap_material_coeff=3.4,
+        electrode_material_cost=3.41,
+        solution={
+            "applied_current": 17096.3045,
+            "cell_voltage": 2,
+            "ohmic_resistance": 2.925e-5,
+            "power_required": 34192.609,
+        },
+        costing={
+            "costing.LCOW": 0.4696,
+            "costing.electricity_intensity": 0.21057,
+            "unit.costing.capital_cost_reactor": 162180.930,
+            "unit.costing.capital_cost_power_supply": 17976.2465,
+            "unit.costing.capital_cost_electrodes": 18541.1436,
+        },
+    ),
+    ECCase(
+        id="OverpotentialCalculation",
+        config={
+            "reactor_material": "stainless_steel",
+            "overpotential_calculation": "calculated",
+        },
+        electrode_material=ElectrodeMaterial.aluminum,
+        reactor_material=ReactorMaterial.stainless_steel,
+        overpotential_calculation=OverpotentialCalculation.calculated,
+        mw_electrode_material=0.027,
+        valence_electrode_material=3,
+        density_electrode_material=2710,
+        ec_reactor_cap_material_coeff=3.4,
+        electrode_material_cost=2.23,
+        solution={
+            "applied_current": 53188.5028,
+            "cell_voltage": 2.49011,
+            "ohmic_resistance": 9.4e-6,
+            "power_required": 132445,
+        },
+        costing={
+            "costing.LCOW": 0.406240,
+            "costing.electricity_intensity": 0.81564,
+            "unit.costing.capital_cost_reactor": 270278.669,
+            "unit.costing.capital_cost_power_supply": 69631.117,
+            "unit.costing.capital_cost_electrodes": 13006.16527,
+        },
+    ),
+]
+
+
+# each case shares one model across its tests, so under pytest-xdist a case must
+# stay on one worker; run e.g. `pytest -n 4 --dist loadgroup` to spread the cases
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(c, id=c.id, marks=pytest.mark.xdist_group(name=f"ec_zo_{c.id}"))
+        for c in cases
+    ],
+    scope="class",
+)
+class TestECZO:
     @pytest.fixture(scope="class")
-    def model(self):
-        m = ConcreteModel()
-        m.db = Database()
-
-        m.fs = FlowsheetBlock(dynamic=False)
-        m.fs.params = WaterParameterBlock(
-            solute_list=[
-                "tds",
-                "tss",
-                "toc",
-            ]
-        )
-
-        m.fs.unit = ElectrocoagulationZO(
-            property_package=m.fs.params,
-            database=m.db,
-            reactor_material="stainless_steel",
-            overpotential_calculation="calculated",
-        )
-
-        m.fs.unit.inlet.flow_mass_comp[0, "H2O"].fix(43.8)
-        m.fs.unit.inlet.flow_mass_comp[0, "toc"].fix(0.004599)
-        m.fs.unit.inlet.flow_mass_comp[0, "tss"].fix(0.5527998)
-        m.fs.unit.inlet.flow_mass_comp[0, "tds"].fix(5.256)
-
-        return m
+    def model(self, case):
+        return build_model(**case.config)
 
     @pytest.mark.unit
-    def test_build(self, model):
-        assert isinstance(model.fs.unit.config.electrode_material, ElectrodeMaterial)
-        assert isinstance(model.fs.unit.config.reactor_material, ReactorMaterial)
-        assert isinstance(
-            model.fs.unit.config.overpotential_calculation, OverpotentialCalculation
-        )
-        assert model.fs.unit.config.electrode_material == ElectrodeMaterial.aluminum
-        assert model.fs.unit.config.reactor_material == ReactorMaterial.stainless_steel
-        assert (
-            model.fs.unit.config.overpotential_calculation
-            == OverpotentialCalculation.calculated
-        )
-        assert value(model.fs.unit.mw_electrode_material) == 0.027
-        assert value(model.fs.unit.valence_electrode_material) == 3
-        assert value(model.fs.unit.density_electrode_material) == 2710
-        assert model.fs.unit.config.database == model.db
-        assert model.fs.unit._tech_type == "electrocoagulation"
-        assert isinstance(model.fs.unit.mw_electrode_material, Param)
-        assert isinstance(model.fs.unit.valence_electrode_material, Param)
-        assert isinstance(model.fs.unit.density_electrode_material, Param)
-        assert isinstance(model.fs.unit.recovery_frac_mass_H2O, Var)
-        assert isinstance(model.fs.unit.removal_frac_mass_comp, Var)
-        assert isinstance(model.fs.unit.power_required, Var)
-        assert isinstance(model.fs.unit.overpotential, Var)
-        assert isinstance(model.fs.unit.ohmic_resistance, Var)
-        assert isinstance(model.fs.unit.overpotential_k1, Var)
-        assert isinstance(model.fs.unit.overpotential_k2, Var)
+    def test_build(self, model, case):
+        ec = model.fs.unit
+        assert isinstance(ec.config.electrode_material, ElectrodeMaterial)
+        assert isinstance(ec.config.reactor_material, ReactorMaterial)
+        assert isinstance(ec.config.overpotential_calculation, OverpotentialCalculation)
+        assert ec.config.electrode_material == case.electrode_material
+        assert ec.config.reactor_material == case.reactor_material
+        assert ec.config.overpotential_calculation == case.overpotential_calculation
+        assert value(ec.mw_electrode_material) == case.mw_electrode_material
+        assert value(ec.valence_electrode_material) == case.valence_electrode_material
+        assert value(ec.density_electrode_material) == case.density_electrode_material
+        assert ec.config.database == model.db
+        assert ec._tech_type == "electrocoagulation"
+        assert isinstance(ec.mw_electrode_material, Param)
+        assert isinstance(ec.valence_electrode_material, Param)
+        assert isinstance(ec.density_electrode_material, Param)
+        assert isinstance(ec.recovery_frac_mass_H2O, Var)
+        assert isinstance(ec.removal_frac_mass_comp, Var)
+        assert isinstance(ec.power_required, Var)
+        assert isinstance(ec.overpotential, Var)
+        assert isinstance(ec.ohmic_resistance, Var)
+        if case.overpotential_calculation == OverpotentialCalculation.calculated:
+            assert isinstance(ec.overpotential_k1, Var)
+            assert isinstance(ec.overpotential_k2, Var)
 
     @pytest.mark.component
     def test_load_parameters(self, model):
+        ec = model.fs.unit
         data = model.db.get_unit_operation_parameters("electrocoagulation")
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.8
-        model.fs.unit.load_parameters_from_database(use_default_removal=True)
-        assert model.fs.unit.recovery_frac_mass_H2O[0].value == 0.99
+        assert ec.recovery_frac_mass_H2O[0].value == 0.8
+        ec.load_parameters_from_database(use_default_removal=True)
+        assert ec.recovery_frac_mass_H2O[0].value == 0.99
 
-        for (t, j), v in model.fs.unit.removal_frac_mass_comp.items():
+        for (t, j), v in ec.removal_frac_mass_comp.items():
             assert v.fixed
             if j not in data["removal_frac_mass_comp"]:
                 assert v.value == data["default_removal_frac_mass_comp"]["value"]
@@ -505,68 +278,39 @@ class TestECZO_OverpotentialCalculation:
 
     @pytest.mark.component
     def test_scaling(self, model):
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("H2O"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tds"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e-3, index=("tss"))
-        model.fs.params.set_default_scaling("flow_mass_comp", 1e4, index=("toc"))
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["H2O"], 1e3
-        )
-        iscale.set_scaling_factor(
-            model.fs.unit.properties_byproduct[0].flow_mass_comp["tss"], 1e3
-        )
+        set_scaling(model)
         iscale.calculate_scaling_factors(model)
-        badly_scaled_var_list = list(iscale.badly_scaled_var_generator(model))
-        assert len(badly_scaled_var_list) == 0
+        # stop at the first badly scaled var; only list them all on failure
+        assert next(iscale.badly_scaled_var_generator(model), None) is None, [
+            (v.name, val) for v, val in iscale.badly_scaled_var_generator(model)
+        ]
 
     @pytest.mark.component
     def test_initialize(self, model):
         initialization_tester(model)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solve(self, model):
+    def test_solve(self, model, solver):
         results = solver.solve(model)
 
         # Check for optimal solution
         assert check_optimal_termination(results)
 
     @pytest.mark.solver
-    @pytest.mark.skipif(solver is None, reason="Solver not available")
     @pytest.mark.component
-    def test_solution(self, model):
-        assert pytest.approx(43.3619999, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["H2O"]
-        )
-        assert pytest.approx(1.5768, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tds"]
-        )
-        assert pytest.approx(0.165839, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["tss"]
-        )
-        assert pytest.approx(0.00137970000, rel=1e-2) == value(
-            model.fs.unit.properties_treated[0].flow_mass_comp["toc"]
-        )
-        assert pytest.approx(53188.5028, rel=1e-2) == value(
-            model.fs.unit.applied_current
-        )
-        assert pytest.approx(2.49011, rel=1e-2) == value(model.fs.unit.cell_voltage)
-        assert pytest.approx(9.4e-6, rel=1e-2) == value(model.fs.unit.ohmic_resistance)
-        assert pytest.approx(132445, rel=1e-2) == value(model.fs.unit.power_required)
+    def test_solution(self, model, case):
+        ec = model.fs.unit
+        # flow_mass_comp is a Var, so read its values directly in a single pass
+        flow_mass_comp = ec.properties_treated[0].flow_mass_comp
+        assert pytest.approx(
+            np.fromiter(treated_flow_mass_comp.values(), dtype=float), rel=1e-2
+        ) == np.array([flow_mass_comp[j].value for j in treated_flow_mass_comp])
+        for v, expected in case.solution.items():
+            assert pytest.approx(expected, rel=1e-2) == getattr(ec, v).value, v
 
     @pytest.mark.component
-    def test_costing(self, model):
-
+    def test_costing(self, model, case, solver):
         m = model
         ec = m.fs.unit
         m.fs.costing = ZeroOrderCosting()
@@ -575,40 +319,29 @@ class TestECZO_OverpotentialCalculation:
         m.fs.costing.cost_process()
         m.fs.costing.add_LCOW(ec.properties_treated[0].flow_vol)
         m.fs.costing.add_electricity_intensity(ec.properties_treated[0].flow_vol)
-        assert "aluminum" in m.fs.costing._registered_flows
+        assert case.electrode_material.value in m.fs.costing._registered_flows
         assert (
             value(m.fs.costing.electrocoagulation.ec_reactor_cap_material_coeff[None])
-            == 3.4
+            == case.ec_reactor_cap_material_coeff
         )
         assert (
-            value(m.fs.costing.electrocoagulation.electrode_material_cost[None]) == 2.23
+            value(m.fs.costing.electrocoagulation.electrode_material_cost[None])
+            == case.electrode_material_cost
         )
         assert isinstance(m.fs.costing.electrocoagulation, Block)
         assert isinstance(
             m.fs.costing.electrocoagulation.ec_power_supply_base_slope, Var
         )
         assert isinstance(m.fs.costing.electrocoagulation.ec_reactor_cap_base, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost, Var)
-        assert isinstance(m.fs.unit.costing.capital_cost_constraint, Constraint)
+        assert isinstance(ec.costing.capital_cost, Var)
+        assert isinstance(ec.costing.capital_cost_constraint, Constraint)
 
-        assert degrees_of_freedom(m.fs.unit) == 0
+        assert degrees_of_freedom(ec) == 0
 
         results = solver.solve(m)
         check_optimal_termination(results)
-        assert pytest.approx(0.406240, rel=1e-3) == value(m.fs.costing.LCOW)
-        assert pytest.approx(0.81564, rel=1e-3) == value(
-            m.fs.costing.electricity_intensity
-        )
-        assert pytest.approx(270278.669, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_reactor
-        )
-        assert pytest.approx(69631.117, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_power_supply
-        )
-
-        assert pytest.approx(13006.16527, rel=1e-3) == value(
-            m.fs.unit.costing.capital_cost_electrodes
-        )
+        for v, expected in case.costing.items():
+            assert pytest.approx(expected, rel=1e-3) == value(attrgetter(v)(m.fs)), v
 
         assert (
             ec.costing.electricity_flow in m.fs.costing._registered_flows["electricity"]